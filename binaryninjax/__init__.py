@@ -1,6 +1,7 @@
 from __future__ import print_function
-import sys, os, traceback
+import sys, os, time, heapq, itertools, traceback
 from functools import wraps
+from contextlib import contextmanager
 import binaryninja as bn
 from binaryninja import core as bnc
 import sip
@@ -11,6 +12,9 @@ from ctypes import byref as c_byref, cast as c_cast, sizeof as c_sizeof
 from ctypes import c_int, c_void_p, c_char_p, c_int64
 
 from ._selfsym import resolve_symbol
+from ._bindings import class_symbols, load_binding_table
+from ._strings import string_index, release_string_indexes, close_string_indexes
+from ._batch import BatchAnalysis
 
 
 try:
@@ -19,6 +23,7 @@ try:
 except NameError:
     pass
 _on_reload = []
+_on_reload.append(close_string_indexes)
 
 
 def on_main_thread(func):
@@ -50,6 +55,19 @@ def on_main_thread(func):
     return wrapper
 
 
+@contextmanager
+def _updates_suspended(*q_widgets):
+    """Suspend repaints of `q_widgets` until the block exits, then repaint them once."""
+    suspended = [q_widget for q_widget in q_widgets if q_widget.updatesEnabled()]
+    for q_widget in suspended:
+        q_widget.setUpdatesEnabled(False)
+    try:
+        yield
+    finally:
+        for q_widget in suspended:
+            q_widget.setUpdatesEnabled(True)
+
+
 def _q_meta_object_for_class(name):
     return sip.wrapinstance(resolve_symbol('_ZN{}{}16staticMetaObjectE'
                                            .format(len(name), name)),
@@ -90,20 +108,22 @@ class _CObjectProxy(object):
 
     def __getattr__(self, attr):
         if attr in self._c_api:
-            func_name, func_sig = self._c_api[attr]
-            if func_name not in self._c_funcptrs:
-                func_addr = resolve_symbol(func_name)
-                if func_addr is None:
-                    raise AttributeError("Symbol {} is not defined".format(func_name))
-                self._c_funcptrs[func_name] = func_addr
-            func_addr = self._c_funcptrs[func_name]
-
-            proxy = _CMethodProxy(func_sig(func_addr), self._c_ptr)
+            proxy = self._method(*self._c_api[attr])
             setattr(self, attr, proxy)
             return proxy
         else:
             raise AttributeError("undefined method '{}'".format(attr))
 
+    def _method(self, func_name, func_sig):
+        if func_name not in self._c_funcptrs:
+            func_addr = resolve_symbol(func_name)
+            if func_addr is None:
+                raise AttributeError("Symbol {} is not defined".format(func_name))
+            self._c_funcptrs[func_name] = func_addr
+        func_addr = self._c_funcptrs[func_name]
+
+        return _CMethodProxy(func_sig(func_addr), self._c_ptr)
+
     def _pointer(self):
         return sip.unwrapinstance(self._c_ptr)
 
@@ -157,6 +177,24 @@ class _QObjectProxy(_CObjectProxy):
     def _methods(self):
         return self._q_methods[self._q_meta_object]
 
+    def _native(self, name, restype, argtypes=None):
+        # Generated bindings are only ever used when asked for explicitly: the return type
+        # is not recorded in a mangled name, and a method returning a class by value would
+        # expect a hidden result pointer in place of `this`.
+        table = load_binding_table(str(self._className()))
+        if name not in table:
+            raise AttributeError("undefined native method '{}'".format(name))
+        func_name, argument_count = table[name]
+        if argtypes is None:
+            if argument_count is None:
+                raise TypeError("argument types of native method '{}' must be specified"
+                                .format(name))
+            argtypes = [c_void_p] * argument_count
+        return self._method(func_name, CFUNCTYPE(restype, c_void_p, *argtypes))
+
+    def _native_methods(self):
+        return sorted(load_binding_table(str(self._className())))
+
     def _properties(self):
         return self._q_properties[self._q_meta_object]
 
@@ -170,6 +208,16 @@ class _QObjectProxy(_CObjectProxy):
         return children
 
 
+def _find_q_object(q_object, q_meta_object):
+    if q_object.metaObject() == q_meta_object:
+        return q_object
+    for child in q_object.children():
+        found = _find_q_object(child, q_meta_object)
+        if found is not None:
+            return found
+    return None
+
+
 _new          = _CStaticMethodProxy('_Znwm',
                                     CFUNCTYPE(c_void_p, c_int))
 _delete       = _CStaticMethodProxy('_ZdlPv',
@@ -204,6 +252,15 @@ class _QString(object):
         return self._c._c_ptr
 
 
+def _reloaded_init_callbacks(init_callbacks):
+    # Callbacks registered before priorities existed are kept across a reload as bare
+    # functions; convert them in place.
+    init_callbacks[:] = [init_callback if isinstance(init_callback, tuple)
+                         else (init_callback, 0, False)
+                         for init_callback in init_callbacks]
+    return init_callbacks
+
+
 class MainWindow(object):
     """
     Main Binary Ninja window.
@@ -228,7 +285,7 @@ class MainWindow(object):
     }
 
     try:
-        _init_callbacks = MainWindow._init_callbacks
+        _init_callbacks = _reloaded_init_callbacks(MainWindow._init_callbacks)
         _init_set = ViewFrame._init_set
     except NameError:
         _init_callbacks = []
@@ -244,19 +301,29 @@ class MainWindow(object):
                                     QtWidgets.QMainWindow))
 
     @classmethod
-    def addInitCallback(cls, fn):
+    def addInitCallback(cls, fn, priority=0, deferred=False):
         """
         Registers ``fn`` to be called each time a new main window is opened.
 
+        Callbacks with a higher ``priority`` run first. Deferred callbacks do not run
+        while the main window is being shown, but later, when the event loop is idle;
+        see :func:`setInitCallbackBudget`.
+
         :param fn: callback function
         :type fn: function(:class:`MainWindow`)
+        :param priority: callback priority
+        :type priority: int
+        :param deferred: whether the callback may be deferred
+        :type deferred: bool
         """
-        cls._init_callbacks.append(fn)
+        cls._init_callbacks.append((fn, priority, deferred))
+        cls._init_callbacks.sort(key=lambda init_callback: -init_callback[1])
 
     @classmethod
     def removeInitCallback(cls, fn):
         """Unregisters ``fn``."""
-        cls._init_callbacks.remove(fn)
+        cls._init_callbacks[:] = [init_callback for init_callback in cls._init_callbacks
+                                  if init_callback[0] is not fn]
 
     def __init__(self, q_main_window):
         self.q = _QObjectProxy(self._q_meta_object, q_main_window, self._c_api)
@@ -299,7 +366,98 @@ class MainWindow(object):
 
     def closeAll(self):
         """Closes all tabs."""
-        self.q.closeTab()
+        self.closeTabs()
+
+    def _getTabWidgets(self):
+        # Do not descend into view frames; the info panel has its own tab widget.
+        tab_widgets = []
+        def find_all(q_object):
+            for child in q_object.children():
+                if child.metaObject() == ViewFrame._q_meta_object:
+                    continue
+                if isinstance(child, QtWidgets.QTabWidget):
+                    tab_widgets.append(child)
+                find_all(child)
+        find_all(self.q._q_object)
+        return tab_widgets
+
+    def _getTabs(self):
+        tabs = []
+        for q_tab_widget in self._getTabWidgets():
+            for index in range(q_tab_widget.count()):
+                q_page = q_tab_widget.widget(index)
+                q_view_frame = _find_q_object(q_page, ViewFrame._q_meta_object)
+                if q_view_frame is not None:
+                    tabs.append((q_tab_widget, index, ViewFrame(q_view_frame)))
+        return tabs
+
+    @on_main_thread
+    def getViewFrames(self):
+        """
+        :return: view frames for all tabs in this window
+        :rtype: list of :class:`ViewFrame`
+        """
+        return [view_frame for _, _, view_frame in self._getTabs()]
+
+    def _forEachTab(self, predicate, slot):
+        # Pages are collected up front, since indexes shift as tabs go away.
+        tabs = [(q_tab_widget, q_tab_widget.widget(index))
+                for q_tab_widget, index, view_frame in self._getTabs()
+                if predicate is None or predicate(view_frame)]
+        removed = 0
+        with _updates_suspended(self.q._q_object):
+            for q_tab_widget, q_page in tabs:
+                if sip.isdeleted(q_tab_widget) or sip.isdeleted(q_page):
+                    continue
+                index = q_tab_widget.indexOf(q_page)
+                if index == -1:
+                    continue
+                q_tab_widget.setCurrentIndex(index)
+                slot()
+                # The slot may leave the tab in place, e.g. if a save prompt is cancelled.
+                if sip.isdeleted(q_tab_widget) or sip.isdeleted(q_page) or \
+                        q_tab_widget.indexOf(q_page) == -1:
+                    removed += 1
+        return removed
+
+    @on_main_thread
+    def closeTabs(self, predicate=None):
+        """
+        Closes every tab for which ``predicate`` returns ``True``, or all tabs if ``predicate``
+        is ``None``. The window is repainted once, after all tabs are closed.
+
+        :param predicate: tab filter
+        :type predicate: function(:class:`ViewFrame`) -> bool
+        :return: number of tabs actually closed
+        """
+        return self._forEachTab(predicate, self.q.closeTab)
+
+    @on_main_thread
+    def openFilenames(self, filenames):
+        """
+        Opens each of the given filenames in a new tab. The window is repainted once,
+        after all files are opened.
+
+        :param filenames: files to open
+        :type filenames: list of str
+        """
+        with _updates_suspended(self.q._q_object):
+            for filename in filenames:
+                q_filename = _QString(filename)
+                self.q.openFilename(q_filename._pointer())
+
+    @on_main_thread
+    def newWindowForTabs(self, predicate=None):
+        """
+        Extracts every tab for which ``predicate`` returns ``True``, or all tabs if
+        ``predicate`` is ``None``, into a new window each. See :meth:`newWindowForTab`.
+        This window is repainted once, after all tabs are extracted.
+
+        :param predicate: tab filter
+        :type predicate: function(:class:`ViewFrame`) -> bool
+        :return: number of tabs actually extracted
+        """
+        return self._forEachTab(predicate, self.q.newWindowForTab)
 
     def navigateBack(self):
         """Navigates back in history."""
@@ -319,6 +477,50 @@ class MainWindow(object):
         q_filename = _QString(filename)
         self.q.openFilename(q_filename._pointer())
 
+    def analyzeAndOpenFilenames(self, filenames, max_workers=None, output_dir=None):
+        """
+        Analyzes the given filenames in headless worker processes, saves the results as
+        databases, and opens each database in a new tab once it is ready. Progress is
+        shown in the status bar of this window.
+
+        The workers are started with the interpreter named by the ``BINARYNINJAX_PYTHON``
+        environment variable, or ``python`` if it is not set, and need a license that
+        allows headless use.
+
+        :param filenames: files to analyze
+        :type filenames: list of str
+        :param max_workers:
+            number of concurrent workers; 2 by default, since every worker runs a full
+            analysis that uses several threads and a lot of memory
+        :type max_workers: int
+        :param output_dir:
+            directory to save databases in; by default each database is saved next to
+            its file. Existing databases are never overwritten: if ``sample.bndb`` exists,
+            the result is saved as ``sample.1.bndb``, and so on
+        :return:
+            a handle whose ``cancel()`` method stops starting new workers, terminates
+            the running ones and deletes their unfinished databases
+        """
+        def on_progress(done, failed, total):
+            message = "Analyzed {} of {} files".format(done + failed, total)
+            if failed:
+                message += " ({} failed)".format(failed)
+            self._showStatusMessage(message)
+
+        def on_cancel(done, failed, total):
+            self._showStatusMessage("Analysis cancelled after {} of {} files"
+                                    .format(done + failed, total))
+
+        batch = BatchAnalysis(filenames, self.openFilename, on_progress, on_cancel,
+                              max_workers=max_workers, output_dir=output_dir)
+        on_progress(0, 0, batch.total)
+        batch.start()
+        return batch
+
+    @on_main_thread
+    def _showStatusMessage(self, message):
+        self.q.statusBar().showMessage(message)
+
     def openUrlDialog(self):
         """Opens the URL open dialog."""
         self.q.openUrlDialog()
@@ -370,26 +572,36 @@ class ViewFrame(object):
     }
 
     try:
-        _init_callbacks = ViewFrame._init_callbacks
+        _init_callbacks = _reloaded_init_callbacks(ViewFrame._init_callbacks)
         _init_set = ViewFrame._init_set
     except NameError:
         _init_callbacks = []
         _init_set = set()
 
     @classmethod
-    def addInitCallback(cls, fn):
+    def addInitCallback(cls, fn, priority=0, deferred=False):
         """
         Registers ``fn`` to be called each time a new view frame (i.e. a tab) is opened.
 
+        Callbacks with a higher ``priority`` run first. Deferred callbacks do not run
+        while the view frame is being shown, but later, when the event loop is idle;
+        see :func:`setInitCallbackBudget`.
+
         :param fn: callback function
         :type fn: function(:class:`ViewFrame`)
+        :param priority: callback priority
+        :type priority: int
+        :param deferred: whether the callback may be deferred
+        :type deferred: bool
         """
-        cls._init_callbacks.append(fn)
+        cls._init_callbacks.append((fn, priority, deferred))
+        cls._init_callbacks.sort(key=lambda init_callback: -init_callback[1])
 
     @classmethod
     def removeInitCallback(cls, fn):
         """Unregisters ``fn``."""
-        cls._init_callbacks.remove(fn)
+        cls._init_callbacks[:] = [init_callback for init_callback in cls._init_callbacks
+                                  if init_callback[0] is not fn]
 
     def __init__(self, q):
         self.q = _QObjectProxy(self._q_meta_object, q, self._c_api)
@@ -451,6 +663,30 @@ class InfoPanel(object):
 
     _q_meta_object = _q_meta_object_for_class('InfoPanel')
 
+    try:
+        _lazy_tabs = InfoPanel._lazy_tabs
+    except NameError:
+        _lazy_tabs = []
+
+    @classmethod
+    def addLazyTabFactory(cls, label, factory, unload_after=None):
+        """
+        Registers ``factory`` to provide a tab in the info panel of each new view frame.
+        See :meth:`addLazyTab`.
+
+        :param label: tab label
+        :param factory: widget factory
+        :type factory: function(:class:`InfoPanel`) -> ``QtWidgets.QWidget``
+        :param unload_after: see :meth:`addLazyTab`
+        """
+        cls._lazy_tabs.append((label, factory, unload_after))
+
+    @classmethod
+    def removeLazyTabFactory(cls, factory):
+        """Unregisters ``factory``. Tabs already added to open view frames are kept."""
+        cls._lazy_tabs[:] = [lazy_tab for lazy_tab in cls._lazy_tabs
+                             if lazy_tab[1] is not factory]
+
     def __init__(self, q):
         self.q = _QObjectProxy(self._q_meta_object, q)
 
@@ -463,6 +699,90 @@ class InfoPanel(object):
             if child.metaObject() == QtWidgets.QTabWidget.staticMetaObject:
                 return child
 
+    @on_main_thread
+    def addLazyTab(self, label, factory, unload_after=None):
+        """
+        Adds a tab whose contents are built by ``factory`` only once the tab is first shown.
+        Until then, the tab contains an empty placeholder widget.
+
+        :param label: tab label
+        :param factory: widget factory
+        :type factory: function(:class:`InfoPanel`) -> ``QtWidgets.QWidget``
+        :param unload_after:
+            if not ``None``, destroy the widget after the tab has been hidden for this many
+            seconds; it will be built again by ``factory`` when the tab is shown next
+        :type unload_after: float
+        :return: index of the new tab
+        """
+        lazy_tab = _LazyTab(self, label, factory, unload_after)
+        return self.getTabWidget().indexOf(lazy_tab.q_placeholder)
+
+
+class _LazyTab(QtCore.QObject):
+    def __init__(self, info_panel, label, factory, unload_after):
+        q_tab_widget = info_panel.getTabWidget()
+        # Parented to the tab widget, so it lives exactly as long as the info panel does.
+        QtCore.QObject.__init__(self, q_tab_widget)
+        self._info_panel = info_panel
+        self._factory = factory
+        self._q_widget = None
+
+        self._q_unload_timer = None
+        if unload_after is not None:
+            self._q_unload_timer = QtCore.QTimer(self)
+            self._q_unload_timer.setSingleShot(True)
+            self._q_unload_timer.setInterval(int(unload_after * 1000))
+            self._q_unload_timer.timeout.connect(self._unload)
+
+        self.q_placeholder = QtWidgets.QWidget()
+        self._q_layout = QtWidgets.QVBoxLayout(self.q_placeholder)
+        self._q_layout.setContentsMargins(0, 0, 0, 0)
+        self.q_placeholder.installEventFilter(self)
+        q_tab_widget.addTab(self.q_placeholder, label)
+
+    def eventFilter(self, watched, event):
+        if event.type() == QtCore.QEvent.Show:
+            if self._q_unload_timer is not None:
+                self._q_unload_timer.stop()
+            if self._q_widget is None:
+                self._load()
+        elif event.type() == QtCore.QEvent.Hide:
+            if self._q_unload_timer is not None and self._q_widget is not None:
+                self._q_unload_timer.start()
+        return False
+
+    def _load(self):
+        try:
+            q_widget = self._factory(self._info_panel)
+            if not isinstance(q_widget, QtWidgets.QWidget):
+                raise TypeError("lazy tab factory {!r} returned {!r}, not a widget"
+                                .format(self._factory, q_widget))
+            self._q_layout.addWidget(q_widget)
+            self._q_widget = q_widget
+        except:
+            bn.log.log_error(traceback.format_exc())
+            self._q_widget = None
+
+    def _unload(self):
+        if self._q_widget is None or self.q_placeholder.isVisible():
+            return
+        self._q_layout.removeWidget(self._q_widget)
+        self._q_widget.deleteLater()
+        self._q_widget = None
+
+
+def _add_lazy_tabs(view_frame):
+    if not InfoPanel._lazy_tabs:
+        return
+    info_panel = view_frame.getInfoPanel()
+    if info_panel is None:
+        return
+    for label, factory, unload_after in InfoPanel._lazy_tabs:
+        _LazyTab(info_panel, label, factory, unload_after)
+
+ViewFrame.addInitCallback(_add_lazy_tabs)
+_on_reload.append(lambda: ViewFrame.removeInitCallback(_add_lazy_tabs))
+
 
 _bn_new_ref_fns = {}
 
@@ -559,6 +879,11 @@ class StringsView(View):
                              CFUNCTYPE(c_int, c_void_p, c_int64))
     }
 
+    try:
+        _search_owners = StringsView._search_owners
+    except NameError:
+        _search_owners = set()
+
     def getBinaryView(self):
         """
         :return: the binary view of this view
@@ -573,6 +898,97 @@ class StringsView(View):
         """
         return self.q.navigate(addr) != 0
 
+    def search(self, pattern, regex=False, page_size=100):
+        """
+        Searches the strings of the binary view. Strings are looked up in an index that is
+        built in the background the first time a binary view is searched, and then kept
+        up to date as analysis finds new strings; strings that are not indexed yet
+        are not found. The index is dropped once every strings view that searched it
+        is closed.
+
+        :param pattern: substring or regular expression to search for
+        :param regex: whether ``pattern`` is a regular expression
+        :type regex: bool
+        :param page_size: number of results per page
+        :type page_size: int
+        :rtype: :class:`StringSearch`
+        """
+        # The index lives as long as some strings view that searched it.
+        owner = self.q._c_ptr
+        if owner not in self._search_owners:
+            self._search_owners.add(owner)
+            def release():
+                self._search_owners.discard(owner)
+                release_string_indexes(owner)
+            self.q._q_object.destroyed.connect(release)
+
+        query = string_index(self.getBinaryView(), owner).query(pattern, regex)
+        return StringSearch(self, query, page_size)
+
+
+class StringSearch(object):
+    """
+    Results of :meth:`StringsView.search`. Results are computed as pages are requested;
+    paging and navigating through results never repeats the search.
+
+    :ivar page_size: number of results per page
+    """
+
+    def __init__(self, view, query, page_size):
+        self._view = view
+        self._query = query
+        self._cursor = -1
+        self.page_size = page_size
+
+    def isComplete(self):
+        """
+        :return:
+            ``True`` if the string index had been fully built when the search was made,
+            that is, if these results cover all strings found by analysis at that time
+        """
+        return self._query.complete
+
+    def getPage(self, page):
+        """
+        :param page: page number, starting at 0
+        :type page: int
+        :return: matching strings on this page
+        :rtype: list of (address, text)
+        """
+        return self._query.get(page * self.page_size, (page + 1) * self.page_size)
+
+    def count(self):
+        """
+        :return: total number of matching strings
+        """
+        return self._query.count()
+
+    def _navigateTo(self, index):
+        if index < 0:
+            return False
+        matches = self._query.get(index, index + 1)
+        if not matches:
+            return False
+        self._cursor = index
+        address, _ = matches[0]
+        return self._view.navigate(address)
+
+    def navigateNext(self):
+        """
+        Highlights the next matching string in the strings view.
+
+        :return: ``True`` if successful, ``False`` otherwise
+        """
+        return self._navigateTo(self._cursor + 1)
+
+    def navigatePrevious(self):
+        """
+        Highlights the previous matching string in the strings view.
+
+        :return: ``True`` if successful, ``False`` otherwise
+        """
+        return self._navigateTo(self._cursor - 1)
+
 
 class LinearView(View):
     """
@@ -656,6 +1072,27 @@ class CrossReferenceItemDelegate(object):
         self.q = _QObjectProxy(self._q_meta_object, q_object, self._c_api)
 
 
+def getClassSymbols(class_name):
+    """
+    Returns the mangled names of all symbols defined by the C++ class ``class_name``, e.g.
+    ``_ZN9ViewFrame4backEv`` for ``ViewFrame``.
+
+    Methods among these that do not have a dedicated binding can be called through
+    the ``q`` proxy of an object with an explicit return type, e.g.
+    ``frame.q._native('back', None)()``, by their name if it is not overloaded or by their
+    mangled name otherwise. Argument types are inferred only if every parameter is
+    a pointer, a reference or an integer; otherwise they must be passed as ``argtypes``.
+    Methods returning a class by value cannot be called this way.
+
+    The first lookup for a class indexes the whole symbol table, which takes several
+    seconds; the result is cached on disk.
+
+    :param class_name: C++ class name
+    :rtype: list of str
+    """
+    return [symbol_name for symbol_name, _, _ in class_symbols(class_name)]
+
+
 def getActiveWindow():
     """Returns the focused main window. See :meth:`MainWindow.getActiveWindow`."""
     return MainWindow.getActiveWindow()
@@ -679,12 +1116,79 @@ def getThemeColor(name):
     return q_color
 
 
+def _run_init_callback(callback, obj):
+    started_at = time.time()
+    try:
+        callback(obj)
+    except:
+        bn.log.log_error(traceback.format_exc())
+    elapsed = time.time() - started_at
+
+    message = "Init callback {}.{} took {:.1f} ms".format(
+        getattr(callback, '__module__', '?'), getattr(callback, '__name__', repr(callback)),
+        elapsed * 1000)
+    if elapsed > _IdleScheduler.budget:
+        bn.log.log_warn(message)
+    else:
+        bn.log.log_debug(message)
+
+
+class _IdleScheduler(QtCore.QObject):
+    budget = 0.010
+
+    def __init__(self, parent):
+        QtCore.QObject.__init__(self, parent)
+        self._queue = []
+        self._counter = itertools.count()
+        # A zero timeout fires once the event loop has no pending events left to process.
+        self._q_timer = QtCore.QTimer(self)
+        self._q_timer.setInterval(0)
+        self._q_timer.timeout.connect(self._run)
+
+    def schedule(self, fn, priority=0):
+        # The counter keeps callbacks with equal priority in FIFO order.
+        heapq.heappush(self._queue, (-priority, next(self._counter), fn))
+        if not self._q_timer.isActive():
+            self._q_timer.start()
+
+    def stop(self):
+        self._q_timer.stop()
+        self._queue = []
+
+    def _run(self):
+        deadline = time.time() + self.budget
+        while self._queue and time.time() < deadline:
+            _, _, fn = heapq.heappop(self._queue)
+            fn()
+        if not self._queue:
+            self._q_timer.stop()
+
+
+def setInitCallbackBudget(budget):
+    """
+    Sets how much time deferred init callbacks may take per event loop iteration.
+    Callbacks that take longer than this are reported in the log.
+
+    :param budget: time budget in milliseconds; 10 by default
+    :type budget: float
+    """
+    _IdleScheduler.budget = budget / 1000.0
+
+
 class _ApplicationEventFilter(QtCore.QObject):
     def __init__(self):
         QtCore.QObject.__init__(self)
+        self._scheduler = _IdleScheduler(self)
         q_app = QtWidgets.QApplication.instance()
         q_app.installEventFilter(self)
         _on_reload.append(lambda: q_app.removeEventFilter(self))
+        _on_reload.append(self._scheduler.stop)
+
+    def _defer(self, callback, priority, watched, obj):
+        def run():
+            if not sip.isdeleted(watched):
+                _run_init_callback(callback, obj)
+        self._scheduler.schedule(run, priority)
 
     def eventFilter(self, watched, event):
         if event.type() == QtCore.QEvent.Show:
@@ -697,11 +1201,11 @@ class _ApplicationEventFilter(QtCore.QObject):
                     watched.destroyed.connect(cleanup)
 
                     obj = cls(watched)
-                    for callback in cls._init_callbacks:
-                        try:
-                            callback(obj)
-                        except:
-                            bn.log.log_error(traceback.format_exc())
+                    for callback, priority, deferred in cls._init_callbacks:
+                        if deferred:
+                            self._defer(callback, priority, watched, obj)
+                        else:
+                            _run_init_callback(callback, obj)
         return False
 
 bn.mainthread.execute_on_main_thread_and_wait(lambda: _ApplicationEventFilter())
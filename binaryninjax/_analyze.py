@@ -0,0 +1,23 @@
+# Headless pre-analysis worker used by MainWindow.analyzeAndOpenFilenames.
+# This file is run as a script in a separate process, and so must not import binaryninjax,
+# which requires the GUI.
+from __future__ import print_function
+import sys
+import binaryninja as bn
+
+
+def main(input_path, output_path):
+    bv = bn.BinaryViewType.get_view_of_file(input_path, update_analysis=False)
+    if bv is None:
+        print("Cannot open {}".format(input_path), file=sys.stderr)
+        return 1
+    bv.update_analysis_and_wait()
+    if not bv.create_database(output_path):
+        print("Cannot save {}".format(output_path), file=sys.stderr)
+        return 1
+    bv.file.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(*sys.argv[1:]))
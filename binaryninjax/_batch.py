@@ -0,0 +1,147 @@
+import os
+import time
+import threading
+import traceback
+import subprocess
+import binaryninja as bn
+from collections import deque
+
+
+_WORKER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '_analyze.py')
+
+_POLL_INTERVAL = 0.2
+
+# Every worker runs a full, multithreaded analysis; more than a couple of them at once
+# easily exhausts memory on large samples.
+DEFAULT_MAX_WORKERS = 2
+
+
+class BatchAnalysis(object):
+    """
+    Analyzes files in a pool of headless worker processes, saving a database for each.
+    `on_done(database_path)` is called for every database saved,
+    `on_progress(done, failed, total)` whenever a worker finishes, and
+    `on_cancel(done, failed, total)` once the running workers are stopped after
+    a cancellation; all are called on the thread managing the pool.
+    """
+
+    def __init__(self, filenames, on_done, on_progress, on_cancel=None,
+                 max_workers=None, output_dir=None, python=None):
+        self._on_done = on_done
+        self._on_progress = on_progress
+        self._on_cancel = on_cancel
+        self._max_workers = max_workers or DEFAULT_MAX_WORKERS
+        self._python = python or os.getenv('BINARYNINJAX_PYTHON', 'python')
+        self._cancelled = False
+
+        if output_dir is not None and not os.path.isdir(output_dir):
+            os.makedirs(output_dir)
+        self._pending = deque()
+        database_paths = set()
+        for filename in filenames:
+            if output_dir is None:
+                stem = filename
+            else:
+                stem = os.path.join(output_dir, os.path.basename(filename))
+            # Never overwrite an existing database, nor let two workers write the same one.
+            database_path = stem + '.bndb'
+            suffix = 1
+            while database_path in database_paths or os.path.exists(database_path):
+                database_path = '{}.{}.bndb'.format(stem, suffix)
+                suffix += 1
+            database_paths.add(database_path)
+            self._pending.append((filename, database_path))
+        self.total = len(self._pending)
+        self.done = 0
+        self.failed = 0
+
+        # The workers need the binaryninja module, but not this plugin.
+        self._env = dict(os.environ)
+        bn_python_path = os.path.dirname(os.path.dirname(os.path.abspath(bn.__file__)))
+        self._env['PYTHONPATH'] = os.pathsep.join(
+            [bn_python_path] + [path for path in [os.getenv('PYTHONPATH')] if path])
+
+        self._thread = threading.Thread(target=self._run)
+        self._thread.daemon = True
+
+    def start(self):
+        self._thread.start()
+
+    def cancel(self):
+        """
+        Stop starting new workers, and terminate the running ones, deleting their
+        unfinished databases.
+        """
+        self._cancelled = True
+
+    def _stop(self, process, database_path):
+        if process.poll() is not None:
+            return # finished on its own; the database, if any, is complete
+        process.terminate()
+        process.wait()
+        for path in (database_path, database_path + '.log'):
+            try:
+                if os.path.exists(path):
+                    os.remove(path)
+            except OSError as error:
+                bn.log.log_warn("Cannot remove {}: {}".format(path, error))
+
+    def _spawn(self, filename, database_path):
+        log = open(database_path + '.log', 'w')
+        try:
+            return subprocess.Popen([self._python, _WORKER_SCRIPT, filename, database_path],
+                                    env=self._env, stdout=log, stderr=subprocess.STDOUT)
+        finally:
+            log.close()
+
+    def _finish(self, filename, database_path, succeeded):
+        if succeeded:
+            self.done += 1
+        else:
+            self.failed += 1
+            bn.log.log_error("Analysis of {} failed, see {}.log"
+                             .format(filename, database_path))
+        if succeeded:
+            try:
+                os.remove(database_path + '.log')
+            except OSError as error:
+                bn.log.log_warn("Cannot remove {}.log: {}".format(database_path, error))
+            try:
+                self._on_done(database_path)
+            except:
+                bn.log.log_error(traceback.format_exc())
+        try:
+            self._on_progress(self.done, self.failed, self.total)
+        except:
+            bn.log.log_error(traceback.format_exc())
+
+    def _run(self):
+        running = []
+        try:
+            while (self._pending or running) and not self._cancelled:
+                while self._pending and len(running) < self._max_workers:
+                    filename, database_path = self._pending.popleft()
+                    try:
+                        process = self._spawn(filename, database_path)
+                    except (IOError, OSError):
+                        bn.log.log_error(traceback.format_exc())
+                        self._finish(filename, database_path, False)
+                        continue
+                    running.append((process, filename, database_path))
+
+                time.sleep(_POLL_INTERVAL)
+                for worker in list(running):
+                    process, filename, database_path = worker
+                    if process.poll() is not None:
+                        running.remove(worker)
+                        self._finish(filename, database_path, process.returncode == 0)
+        except:
+            bn.log.log_error(traceback.format_exc())
+        finally:
+            for process, _, database_path in running:
+                self._stop(process, database_path)
+            if self._cancelled and self._on_cancel is not None:
+                try:
+                    self._on_cancel(self.done, self.failed, self.total)
+                except:
+                    bn.log.log_error(traceback.format_exc())
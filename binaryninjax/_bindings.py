@@ -0,0 +1,136 @@
+import os
+import json
+import binaryninja as bn
+
+from ._selfsym import executable_path, find_symbols, demangle_symbol
+
+
+# A mangled name records parameter types but not the return type. Parameters are only
+# known to be passed as a single pointer-sized integer if they are pointers, references or
+# integral types; anything else (classes by value, floating point, function pointers) may
+# be passed differently, and such methods require explicit argument types.
+_CV_QUALIFIERS = ('const', 'volatile')
+_INTEGRAL_PARAMETERS = frozenset([
+    'bool', 'char', 'signed char', 'unsigned char', 'wchar_t', 'short', 'unsigned short',
+    'int', 'unsigned int', 'long', 'unsigned long', 'long long', 'unsigned long long',
+])
+
+# Bump whenever the format of cached tables changes.
+_CACHE_FORMAT = 2
+
+
+def class_symbols(class_name):
+    """Return ``(name, address, is_function)`` for every member symbol of `class_name`."""
+    prefix = '{}{}'.format(len(class_name), class_name)
+    return find_symbols('_ZN' + prefix) + find_symbols('_ZNK' + prefix)
+
+
+def _split_parameters(parameters):
+    result = []
+    depth = 0
+    start = 0
+    for index, char in enumerate(parameters):
+        if char in '<(':
+            depth += 1
+        elif char in '>)':
+            depth -= 1
+        elif char == ',' and depth == 0:
+            result.append(parameters[start:index].strip())
+            start = index + 1
+    result.append(parameters[start:].strip())
+    if result in ([''], ['void']):
+        return []
+    return result
+
+
+def _parse_method(class_name, demangled):
+    # E.g. "ViewFrame::setViewType(QString const&)".
+    qualifier = class_name + '::'
+    if demangled is None or not demangled.startswith(qualifier) or '(' not in demangled:
+        return None
+    name, parameters = demangled[len(qualifier):].split('(', 1)
+    if '::' in name or name == class_name or name.startswith(('~', 'operator')):
+        return None # nested class member, constructor, destructor or operator
+    parameters = _split_parameters(parameters[:parameters.rindex(')')])
+    if all(_is_scalar_parameter(parameter) for parameter in parameters):
+        return name, len(parameters)
+    return name, None
+
+
+def _is_scalar_parameter(parameter):
+    if parameter.endswith(('*', '&')):
+        return True
+    words = [word for word in parameter.split() if word not in _CV_QUALIFIERS]
+    return ' '.join(words) in _INTEGRAL_PARAMETERS
+
+
+def generate_binding_table(class_name):
+    """
+    Return a binding table ``{name: (mangled_name, argument_count)}`` for the methods
+    of `class_name`, except constructors and destructors. Methods are available under their
+    mangled name, and also under their plain name if it is not overloaded. The argument
+    count is ``None`` unless every parameter is known to be pointer-sized.
+    """
+    table = {}
+    overloads = {}
+    for symbol_name, _, is_function in class_symbols(class_name):
+        if not is_function:
+            continue
+        method = _parse_method(class_name, demangle_symbol(symbol_name))
+        if method is None:
+            continue
+        name, argument_count = method
+        table[symbol_name] = (symbol_name, argument_count)
+        overloads.setdefault(name, set()).add((symbol_name, argument_count))
+    for name, methods in overloads.items():
+        if len(methods) == 1:
+            table[name], = methods
+    return table
+
+
+def _cache_path(class_name):
+    return os.path.join(bn.user_directory(), 'binaryninjax', class_name + '.json')
+
+
+def _executable_stamp():
+    stat = os.stat(executable_path)
+    return [stat.st_size, int(stat.st_mtime)]
+
+
+_binding_tables = {}
+
+def load_binding_table(class_name):
+    """
+    Return the binding table for `class_name`, see :func:`generate_binding_table`.
+    The table is generated once per Binary Ninja build and cached on disk; generating it
+    indexes the whole symbol table, which takes several seconds.
+    """
+    if class_name in _binding_tables:
+        return _binding_tables[class_name]
+
+    stamp = _executable_stamp()
+    cache_path = _cache_path(class_name)
+    table = None
+    try:
+        with open(cache_path) as cache:
+            cached = json.load(cache)
+        if cached['format'] == _CACHE_FORMAT and cached['executable'] == stamp:
+            table = cached['table']
+    except (IOError, OSError, ValueError, KeyError):
+        pass
+
+    if table is None:
+        table = generate_binding_table(class_name)
+        try:
+            if not os.path.isdir(os.path.dirname(cache_path)):
+                os.makedirs(os.path.dirname(cache_path))
+            with open(cache_path, 'w') as cache:
+                json.dump({'format': _CACHE_FORMAT, 'executable': stamp, 'table': table}, cache)
+        except (IOError, OSError):
+            bn.log.log_warn("Cannot cache bindings for {} in {}".format(class_name, cache_path))
+
+    _binding_tables[class_name] = binding_table = {
+        str(name): (str(symbol_name), argument_count)
+        for name, (symbol_name, argument_count) in table.items()
+    }
+    return binding_table
@@ -1,4 +1,5 @@
 import sys
+import bisect
 import ctypes
 import binaryninja
 
@@ -22,10 +23,33 @@ if 'linux' in sys.platform:
             else:
                 return None
 
+        # Sorted by name, so that all symbols sharing a prefix are adjacent.
+        def _index(self):
+            if not hasattr(self, '_names'):
+                symbols = sorted((symbol.name, symbol.entry.st_value,
+                                  symbol.entry.st_info.type == 'STT_FUNC')
+                                 for symbol in self._symtab.iter_symbols()
+                                 if symbol.name and symbol.entry.st_value)
+                self._names = [name for name, _, _ in symbols]
+                self._symbols = symbols
+            return self._names, self._symbols
+
+        def lookup_prefix(self, prefix):
+            names, symbols = self._index()
+            result = []
+            index = bisect.bisect_left(names, prefix)
+            while index < len(names) and names[index].startswith(prefix):
+                name, value, is_function = symbols[index]
+                result.append((name, self._offset + value, is_function))
+                index += 1
+            return result
+
     _self_dll = ctypes.CDLL("binaryninja", handle=0)
     _self_dll.dlsym.restype = ctypes.c_void_p
 
-    _resolver = _SymbolResolver(open(binaryninja.get_install_directory() + '/binaryninja'))
+    executable_path = binaryninja.get_install_directory() + '/binaryninja'
+
+    _resolver = _SymbolResolver(open(executable_path))
     _resolver.set_offset('_end', _self_dll.dlsym(0, '_end'))
 
     def resolve_symbol(symbol_name):
@@ -34,5 +58,25 @@ if 'linux' in sys.platform:
             return symbol_addr
         return _resolver.lookup(symbol_name)
 
+    def find_symbols(prefix):
+        """Return ``(name, address, is_function)`` for every symbol starting with `prefix`."""
+        return _resolver.lookup_prefix(prefix)
+
+    _cxa_demangle = _self_dll['__cxa_demangle']
+    _cxa_demangle.restype = ctypes.c_void_p
+    _cxa_demangle.argtypes = [ctypes.c_char_p, ctypes.c_void_p, ctypes.c_void_p,
+                              ctypes.POINTER(ctypes.c_int)]
+    _self_dll.free.argtypes = [ctypes.c_void_p]
+
+    def demangle_symbol(symbol_name):
+        status = ctypes.c_int()
+        demangled = _cxa_demangle(symbol_name, None, None, ctypes.byref(status))
+        if status.value != 0 or not demangled:
+            return None
+        try:
+            return ctypes.string_at(demangled)
+        finally:
+            _self_dll.free(demangled)
+
 else:
     raise NotImplementedError("Sorry, your platform is not supported")
@@ -0,0 +1,248 @@
+import re
+import bisect
+import threading
+import traceback
+import binaryninja as bn
+from ctypes import cast as c_cast, c_void_p
+
+
+# Strings are indexed one address range at a time, so that the index becomes searchable
+# long before a large binary is fully scanned.
+_BUILD_CHUNK_SIZE = 0x100000
+
+# Strings found by analysis are collected and merged into a small trailing segment,
+# so that queries during analysis never re-join the whole index.
+_MERGE_LIMIT = 4096
+
+_ENCODINGS = {
+    bn.StringType.AsciiString: 'latin-1',
+    bn.StringType.Utf8String:  'utf-8',
+    bn.StringType.Utf16String: 'utf-16',
+    bn.StringType.Utf32String: 'utf-32',
+}
+
+
+class _Segment(object):
+    """An immutable batch of strings, sorted by address."""
+
+    def __init__(self, strings, merged=False):
+        strings = sorted(strings)
+        self.merged = merged
+        self.addresses = [address for address, _ in strings]
+        self.texts = [text for _, text in strings]
+        # All texts joined by NUL, for substring search in a single pass over one buffer.
+        self.blob = u'\0'.join(self.texts)
+        self.starts = []
+        start = 0
+        for text in self.texts:
+            self.starts.append(start)
+            start += len(text) + 1
+
+
+class StringQuery(object):
+    """
+    Matches of `pattern` among the strings of an index snapshot, in the order the strings
+    were indexed. Matches are found lazily, as far as needed to answer a request,
+    and are never recomputed. `complete` tells whether the index was fully built
+    when the snapshot was taken.
+    """
+
+    def __init__(self, segments, live, complete, pattern, regex):
+        self._segments = segments
+        self._live = live
+        self.complete = complete
+        self._matches = []
+        self._segment = 0 # index of the segment being examined
+        self._next = 0    # index of the next string to examine in that segment
+        if regex:
+            self._regex = re.compile(pattern)
+            self._substring = None
+        elif u'\0' in pattern:
+            self._regex = re.compile(re.escape(pattern))
+            self._substring = None
+        else:
+            self._regex = None
+            self._substring = pattern
+
+    def _find_in_segment(self, segment):
+        if self._substring is not None:
+            if self._next >= len(segment.texts):
+                return None
+            offset = segment.blob.find(self._substring, segment.starts[self._next])
+            if offset < 0:
+                return None
+            return bisect.bisect_right(segment.starts, offset) - 1
+        else:
+            for index in range(self._next, len(segment.texts)):
+                if self._regex.search(segment.texts[index]):
+                    return index
+            return None
+
+    def _find_next(self):
+        while self._segment < len(self._segments):
+            segment = self._segments[self._segment]
+            index = self._find_in_segment(segment)
+            if index is None:
+                self._segment += 1
+                self._next = 0
+                continue
+            self._next = index + 1
+            address, text = segment.addresses[index], segment.texts[index]
+            # Skip strings that were removed, or superseded by a later segment.
+            if self._live.get(address) is text:
+                self._matches.append((address, text))
+                return True
+        return False
+
+    def get(self, start, stop):
+        """Return matches ``start`` to ``stop`` as a list of ``(address, text)``."""
+        while len(self._matches) < stop and self._find_next():
+            pass
+        return self._matches[start:stop]
+
+    def count(self):
+        while self._find_next():
+            pass
+        return len(self._matches)
+
+
+class StringIndex(bn.BinaryDataNotification):
+    """
+    Strings of a binary view, built in a background thread and kept up to date
+    as analysis finds or removes strings.
+    """
+
+    def __init__(self, view):
+        bn.BinaryDataNotification.__init__(self)
+        self._view = view
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        self._live = {}     # address -> text, for every string currently in the view
+        self._segments = []
+        self._pending = []  # strings found by analysis, not yet in a segment
+        self.complete = False
+
+        view.register_notification(self)
+        self._thread = threading.Thread(target=self._build)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def close(self):
+        """Stop updating the index and release the binary view."""
+        self._closed.set()
+        self._view.unregister_notification(self)
+        with self._lock:
+            self._live = {}
+            self._segments = []
+            self._pending = []
+
+    def _decode(self, string_type, start, length):
+        encoding = _ENCODINGS.get(string_type, 'latin-1')
+        if encoding in ('utf-16', 'utf-32'):
+            encoding += '-be' if self._view.endianness == bn.Endianness.BigEndian else '-le'
+        return self._view.read(start, length).decode(encoding, 'replace')
+
+    def _chunks(self):
+        # Only scan mapped segments; gaps between them can span gigabytes of address space.
+        ranges = [(segment.start, segment.end) for segment in self._view.segments]
+        if not ranges:
+            ranges = [(self._view.start, self._view.end)]
+        for start, end in ranges:
+            while start < end:
+                length = min(_BUILD_CHUNK_SIZE, end - start)
+                yield start, length
+                start += length
+
+    def _build(self):
+        try:
+            for start, length in self._chunks():
+                if self._closed.is_set():
+                    break
+                strings = [(string.start, self._decode(string.type, string.start, string.length))
+                           for string in self._view.get_strings(start, length)]
+                with self._lock:
+                    strings = [(address, text) for address, text in strings
+                               if address not in self._live]
+                    self._live.update(strings)
+                if strings:
+                    # Joined outside of the lock, so that analysis is never held up by it.
+                    segment = _Segment(strings)
+                    with self._lock:
+                        if not self._closed.is_set():
+                            self._segments.append(segment)
+            with self._lock:
+                self.complete = not self._closed.is_set()
+        except:
+            bn.log.log_error(traceback.format_exc())
+
+    def string_found(self, view, string_type, offset, length):
+        text = self._decode(string_type, offset, length)
+        with self._lock:
+            if self._closed.is_set() or offset in self._live:
+                return
+            self._live[offset] = text
+            self._pending.append((offset, text))
+
+    def string_removed(self, view, string_type, offset, length):
+        with self._lock:
+            self._live.pop(offset, None)
+
+    def _flush(self):
+        # Called with the lock held; only joins the strings found since the last query,
+        # plus the small trailing segment they are merged into.
+        if not self._pending:
+            return
+        strings = self._pending
+        self._pending = []
+        if self._segments and self._segments[-1].merged and \
+                len(self._segments[-1].texts) + len(strings) <= _MERGE_LIMIT:
+            last = self._segments.pop()
+            strings = list(zip(last.addresses, last.texts)) + strings
+        self._segments.append(_Segment(strings, merged=True))
+
+    def query(self, pattern, regex=False):
+        """Return a :class:`StringQuery` for `pattern` over the strings indexed so far."""
+        with self._lock:
+            self._flush()
+            segments = tuple(self._segments)
+            live = self._live
+            complete = self.complete
+        return StringQuery(segments, live, complete, pattern, regex)
+
+
+_string_indexes = {}
+_string_index_owners = {}
+_string_indexes_lock = threading.Lock()
+
+def string_index(view, owner):
+    """
+    Return the string index of `view`, creating it if necessary. The index is kept
+    until every `owner` that asked for it is passed to :func:`release_string_indexes`.
+    """
+    # Every bn.BinaryView wrapper holds its own reference; key by the underlying object.
+    key = c_cast(view.handle, c_void_p).value
+    with _string_indexes_lock:
+        if key not in _string_indexes:
+            _string_indexes[key] = StringIndex(view)
+            _string_index_owners[key] = set()
+        _string_index_owners[key].add(owner)
+        return _string_indexes[key]
+
+
+def release_string_indexes(owner):
+    """Drop `owner` from every index, closing the indexes nothing else owns."""
+    with _string_indexes_lock:
+        for key, owners in list(_string_index_owners.items()):
+            owners.discard(owner)
+            if not owners:
+                _string_indexes.pop(key).close()
+                del _string_index_owners[key]
+
+
+def close_string_indexes():
+    """Stop updating all string indexes and drop them."""
+    with _string_indexes_lock:
+        for index in _string_indexes.values():
+            index.close()
+        _string_indexes.clear()
+        _string_index_owners.clear()